@@ -1,58 +1,83 @@
+import io
+import os
+import re
+import threading
+import time
+import html
 import streamlit as st
 import pandas as pd
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 import pyodbc
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+
+# Rows shown in table previews before the user asks for the full table
+PREVIEW_ROWS = 200
+
+# Patterns for the three fields we scrape from each product_pod
+_TITLE_RE = re.compile(rb'<h3><a[^>]*title="([^"]+)"')
+_PRICE_RE = re.compile(rb'class="price_color">([^<]+)</p>')
+_AVAIL_RE = re.compile(rb'class="instock availability">\s*(?:<i[^>]*></i>)?\s*([^<]+?)\s*</p>', re.S)
 
 def main():
     st.title("📚 Books Dashboard")
     
-    # Initialize session state
-    if 'df' not in st.session_state:
-        st.session_state.df = None
+    # Initialize session state (only the selected source; the data itself is cached across sessions)
+    if 'source' not in st.session_state:
+        st.session_state.source = None
+        st.session_state.just_loaded = False
+    if 'price_numeric' not in st.session_state:
+        _reset_derived_state()
     
     # Sidebar for actions
     st.sidebar.header("Actions")
     
-    # Option 1: Load from CSV
+    # Option 1: Load from CSV (prefers the Parquet cache, falls back to legacy CSV)
     if st.sidebar.button("Load from CSV"):
-        try:
-            st.session_state.df = pd.read_csv("books_data.csv")
-            st.sidebar.success("Data loaded from CSV!")
-        except Exception as e:
-            st.sidebar.error(f"Error loading CSV: {e}")
+        _select_source("csv")
     
     # Option 2: Scrape new data
     if st.sidebar.button("Scrape New Data"):
-        with st.spinner("Scraping book data from website..."):
-            try:
-                data = scrape_books_data()
-                st.session_state.df = pd.DataFrame(data)
-                st.session_state.df = clean_data(st.session_state.df)
-                st.session_state.df.to_csv("books_data.csv", index=False, encoding="utf-8-sig")
-                st.sidebar.success("New data scraped and saved!")
-            except Exception as e:
-                st.sidebar.error(f"Error scraping data: {e}")
+        # An explicit click always re-scrapes instead of reusing the cached result
+        scrape_books_data.clear()
+        load_scrape.clear()
+        _select_source("scrape")
     
     # Option 3: Load from database
     if st.sidebar.button("Load from Database"):
-        try:
-            conn = connect_database()
-            if conn:
-                st.session_state.df = pd.read_sql("SELECT * FROM BooksTable", conn)
-                conn.close()
-                st.sidebar.success("Data loaded from database!")
-        except Exception as e:
-            st.sidebar.error(f"Error loading from database: {e}")
+        _select_source("db")
     
     # Get the dataframe
-    df = st.session_state.df
+    df = None
+    source = st.session_state.source
+    if source is not None:
+        try:
+            if source == "scrape":
+                with st.spinner("Scraping book data from website..."):
+                    df, version = load_scrape()
+                if st.session_state.just_loaded:
+                    df.to_parquet("books_data.parquet", compression="snappy")
+            else:
+                df, version = LOADERS[source]()
+            if st.session_state.just_loaded:
+                st.sidebar.success(LOAD_MESSAGES[source])
+        except Exception as e:
+            st.sidebar.error(f"Error loading data from {source}: {e}")
+            st.session_state.source = None
+        st.session_state.just_loaded = False
     
     if df is None or df.empty:
         st.warning("No data loaded. Please click one of the buttons in the sidebar to load data.")
         return
     
+    # Another session or a TTL refresh can hand back different data for the same source
+    if st.session_state.derived_version != (source, version):
+        _reset_derived_state()
+        st.session_state.derived_version = (source, version)
+    
     # DEBUG: Show what columns we have
     st.sidebar.subheader("Debug Info")
     st.sidebar.write("Columns found:", list(df.columns))
@@ -60,54 +85,52 @@ def main():
     
     # Display raw data
     st.subheader("📖 All Books Data")
-    st.dataframe(df)
+    preview_dataframe(df, key="all_rows")
     
     # Auto-detect columns
-    price_col = detect_column(df, ['price', 'Price', 'price_color'])
-    availability_col = detect_column(df, ['availability', 'Availability', 'stock', 'instock'])
-    title_col = detect_column(df, ['Title', 'title', 'Book_Name', 'Book_Name', 'name'])
+    price_col = detect_column(df, ('price', 'Price', 'price_color'))
+    availability_col = detect_column(df, ('availability', 'Availability', 'stock', 'instock'))
+    title_col = detect_column(df, ('Title', 'title', 'Book_Name', 'Book_Name', 'name'))
     
     st.write(f"**Detected columns:** Title: `{title_col}`, Price: `{price_col}`, Availability: `{availability_col}`")
     
-    # Filter by Price
+    # Compute derived values once per load instead of on every rerun
+    # (the database source filters server-side and only holds a preview locally)
+    if source == "db":
+        st.caption(f"Showing the first {PREVIEW_ROWS} rows; filters below run on the database.")
+    elif price_col:
+        if st.session_state.price_numeric is None:
+            st.session_state.price_numeric = pd.to_numeric(df[price_col], errors='coerce')
+            # Row positions sorted by price (NaNs excluded) so the slider can use searchsorted
+            prices = st.session_state.price_numeric.to_numpy(dtype=float)
+            valid_idx = np.flatnonzero(~np.isnan(prices))
+            st.session_state.sorted_idx = valid_idx[np.argsort(prices[valid_idx], kind='stable')]
+            st.session_state.sorted_prices = prices[st.session_state.sorted_idx]
+        df[price_col] = st.session_state.price_numeric
+    if availability_col and source != "db":
+        if st.session_state.in_stock_mask is None:
+            st.session_state.availability = df[availability_col].astype('category')
+            st.session_state.in_stock_mask = in_stock_mask(st.session_state.availability)
+        df[availability_col] = st.session_state.availability
+    if title_col and source != "db" and st.session_state.title_lower is None:
+        st.session_state.title_lower = df[title_col].astype(str).str.lower().to_numpy(dtype=str)
+    
+    # Filter by Price (the download button lives in the fragment so it follows the slider)
     if price_col:
-        st.subheader("💰 Filter by Price")
-        try:
-            # Ensure price is numeric
-            df[price_col] = pd.to_numeric(df[price_col], errors='coerce')
-            df_clean = df.dropna(subset=[price_col])
-            
-            min_price = int(df_clean[price_col].min())
-            max_price = int(df_clean[price_col].max())
-            default_price = min(max_price, 50)
-            
-            selected_price = st.slider(
-                "Select maximum price:",
-                min_value=min_price,
-                max_value=max_price,
-                value=default_price
-            )
-            
-            filtered_df = df_clean[df_clean[price_col] <= selected_price]
-            st.write(f"**Showing {len(filtered_df)} books priced under {selected_price}**")
-            st.dataframe(filtered_df)
-            
-        except Exception as e:
-            st.error(f"Error with price filtering: {e}")
-            filtered_df = df
+        price_filter_fragment(df, price_col)
     else:
         st.warning("⚠️ Price column not found in the data")
-        filtered_df = df
     
     # Books In Stock
     if availability_col:
         st.subheader("✅ Books In Stock")
         try:
-            # Convert to string and lowercase for comparison
-            in_stock_mask = df[availability_col].astype(str).str.lower().str.contains('in stock', na=False)
-            in_stock_df = df[in_stock_mask]
+            if source == "db":
+                in_stock_df = query_books(availability_col=availability_col, in_stock_only=True)
+            else:
+                in_stock_df = df[st.session_state.in_stock_mask]
             st.write(f"**Found {len(in_stock_df)} books in stock**")
-            st.dataframe(in_stock_df)
+            preview_dataframe(in_stock_df, key="in_stock_rows")
         except Exception as e:
             st.error(f"Error filtering in-stock books: {e}")
     else:
@@ -115,21 +138,16 @@ def main():
     
     # Search Books
     if title_col:
-        st.subheader("🔍 Search Books")
-        search_term = st.text_input("Enter book title to search:")
-        if search_term:
-            try:
-                search_results = df[df[title_col].astype(str).str.contains(search_term, case=False, na=False)]
-                st.write(f"**Found {len(search_results)} matching books**")
-                st.dataframe(search_results)
-            except Exception as e:
-                st.error(f"Error searching books: {e}")
+        search_fragment(df, title_col)
     
     # Visualizations
     if price_col:
         st.subheader("📊 Price Distribution")
+        price_series = None
         try:
-            st.bar_chart(df[price_col])
+            # The database preview is only the first rows, so fetch the price column alone
+            price_series = query_prices(price_col) if source == "db" else df[price_col]
+            st.bar_chart(price_series)
         except Exception as e:
             st.error(f"Error creating chart: {e}")
         
@@ -137,96 +155,404 @@ def main():
         if st.checkbox("Show advanced charts"):
             col1, col2 = st.columns(2)
             
-            with col1:
-                fig, ax = plt.subplots(figsize=(8, 6))
-                ax.hist(df[price_col].dropna(), bins=20, color='lightblue', edgecolor='black')
-                ax.set_title('Price Distribution')
-                ax.set_xlabel('Price')
-                ax.set_ylabel('Count')
-                st.pyplot(fig)
-            
-            with col2:
-                fig, ax = plt.subplots(figsize=(8, 6))
-                ax.boxplot(df[price_col].dropna())
-                ax.set_title('Price Box Plot')
-                ax.set_ylabel('Price')
-                st.pyplot(fig)
+            if price_series is None:
+                st.warning("⚠️ Price data could not be loaded, so advanced charts are unavailable")
+            else:
+                try:
+                    prices = price_series.dropna().to_numpy(dtype=float)
+                    
+                    with col1:
+                        st.image(price_hist_png(prices))
+                    
+                    with col2:
+                        st.image(price_box_png(prices))
+                except Exception as e:
+                    st.error(f"Error creating advanced charts: {e}")
     
     # Download
+    if not price_col:
+        download_section(df)
+
+@st.fragment
+def price_filter_fragment(df, price_col):
+    """Price slider and filtered table, rerun on their own when the slider moves"""
+    st.subheader("💰 Filter by Price")
+    try:
+        sorted_idx = st.session_state.sorted_idx
+        sorted_prices = st.session_state.sorted_prices
+        
+        if st.session_state.source == "db":
+            min_price, max_price = price_bounds(price_col)
+        else:
+            min_price = int(sorted_prices[0])
+            max_price = int(sorted_prices[-1])
+        default_price = min(max_price, 50)
+        
+        selected_price = st.slider(
+            "Select maximum price:",
+            min_value=min_price,
+            max_value=max_price,
+            value=default_price
+        )
+        
+        if st.session_state.source == "db":
+            filtered_df = query_books(price_col=price_col, max_price=selected_price)
+        else:
+            k = np.searchsorted(sorted_prices, selected_price, side='right')
+            # Restore the original row order on the pruned slice
+            filtered_df = df.iloc[np.sort(sorted_idx[:k])]
+        st.write(f"**Showing {len(filtered_df)} books priced under {selected_price}**")
+        preview_dataframe(filtered_df, key="filtered_rows")
+        
+    except Exception as e:
+        st.error(f"Error with price filtering: {e}")
+        filtered_df = df
+    
+    download_section(filtered_df)
+
+@st.fragment
+def search_fragment(df, title_col):
+    """Title search box and results, rerun on their own when the search term changes"""
+    st.subheader("🔍 Search Books")
+    search_term = st.text_input("Enter book title to search:")
+    if search_term:
+        try:
+            if st.session_state.source == "db":
+                search_results = query_books(title_col=title_col, title_like=search_term)
+            else:
+                mask = np.char.find(st.session_state.title_lower, search_term.lower()) >= 0
+                search_results = df[mask]
+            st.write(f"**Found {len(search_results)} matching books**")
+            preview_dataframe(search_results, key="search_rows")
+        except Exception as e:
+            st.error(f"Error searching books: {e}")
+
+def _figure_png(fig):
+    """Render a figure to PNG bytes"""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    return buf.getvalue()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def price_hist_png(prices):
+    """Render the price histogram as PNG bytes"""
+    bins = 20
+    if prices.size:
+        vmin, vmax = float(prices.min()), float(prices.max())
+        width = (vmax - vmin) / bins or 1.0
+        # Bins are uniform, so each value's bin is plain arithmetic instead of a search
+        idx = ((prices - vmin) / width).astype(np.int32).clip(0, bins - 1)
+        counts = np.bincount(idx, minlength=bins)
+    else:
+        vmin, width = 0.0, 1.0
+        counts = np.zeros(bins, dtype=np.int64)
+    
+    # A bare Figure stays out of pyplot's global figure manager and is safe per thread
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    ax.bar(vmin + width * np.arange(bins), counts, width=width, align='edge', color='lightblue', edgecolor='black')
+    ax.set_title('Price Distribution')
+    ax.set_xlabel('Price')
+    ax.set_ylabel('Count')
+    return _figure_png(fig)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def price_box_png(prices):
+    """Render the price box plot as PNG bytes"""
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    ax.boxplot(prices)
+    ax.set_title('Price Box Plot')
+    ax.set_ylabel('Price')
+    return _figure_png(fig)
+
+def preview_dataframe(df, key, rows=PREVIEW_ROWS):
+    """Show the first rows of a dataframe, sending the full table only on request"""
+    st.dataframe(df.head(rows))
+    if len(df) > rows and st.checkbox(f"Show all {len(df)} rows", key=key):
+        st.dataframe(df)
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def csv_bytes(df):
+    """Serialize a dataframe to CSV bytes, once per distinct dataframe"""
+    buf = io.BytesIO()
+    df.to_csv(buf, index=False, encoding='utf-8')
+    return buf.getvalue()
+
+def download_section(filtered_df):
+    """Download button for the filtered data"""
     st.subheader("📥 Download Data")
     st.download_button(
         label="Download Filtered Data as CSV",
-        data=filtered_df.to_csv(index=False).encode('utf-8'),
+        data=csv_bytes(filtered_df),
         file_name='filtered_books.csv',
         mime='text/csv'
     )
 
+def _select_source(source):
+    """Switch the data source for this session and rerun"""
+    _reset_derived_state()
+    st.session_state.source = source
+    st.session_state.just_loaded = True
+    st.rerun()
+
+def _reset_derived_state():
+    """Invalidate values derived from the loaded dataframe"""
+    st.session_state.derived_version = None
+    st.session_state.availability = None
+    st.session_state.price_numeric = None
+    st.session_state.sorted_idx = None
+    st.session_state.sorted_prices = None
+    st.session_state.in_stock_mask = None
+    st.session_state.title_lower = None
+
+# Each loader returns (df, version); the version changes whenever the data does
+
+def load_csv():
+    """Load the saved book data, preferring the Parquet cache over legacy CSV"""
+    if os.path.exists("books_data.parquet"):
+        mtime = os.path.getmtime("books_data.parquet")
+        return _load_parquet_cached("books_data.parquet", mtime), ("books_data.parquet", mtime)
+    mtime = os.path.getmtime("books_data.csv")
+    return _load_csv_cached("books_data.csv", mtime), ("books_data.csv", mtime)
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_scrape():
+    """Scrape and clean fresh book data"""
+    df = clean_data(pd.DataFrame(scrape_books_data()))
+    return df, time.time()
+
+@st.cache_data(ttl=300, show_spinner=False)
+def load_db():
+    """Load the book data from the database"""
+    return read_books_table(), time.time()
+
+LOADERS = {"csv": load_csv, "scrape": load_scrape, "db": load_db}
+LOAD_MESSAGES = {
+    "csv": "Data loaded from file!",
+    "scrape": "New data scraped and saved!",
+    "db": "Data loaded from database!",
+}
+
+def _downcast(df):
+    """Shrink numeric columns to the smallest integer/float dtype that holds them"""
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='floating').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+@st.cache_data(show_spinner=False)
+def _load_csv_cached(path, mtime):
+    """Read a CSV file, cached on its path and modification time"""
+    return _downcast(pd.read_csv(path))
+
+@st.cache_data(show_spinner=False)
+def _load_parquet_cached(path, mtime):
+    """Read a Parquet file, cached on its path and modification time"""
+    return _downcast(pd.read_parquet(path))
+
 def detect_column(df, possible_names):
     """Detect which column name exists in the dataframe"""
+    return _detect_column(tuple(df.columns), possible_names)
+
+@st.cache_data(show_spinner=False)
+def _detect_column(columns, possible_names):
+    """Detect which of the given column names matches, cached on the column names only"""
     for name in possible_names:
-        if name in df.columns:
+        if name in columns:
             return name
     # Try partial matching
-    for col in df.columns:
+    for col in columns:
         for name in possible_names:
             if name.lower() in col.lower():
                 return col
     return None
 
+@st.cache_data(ttl=3600, show_spinner=False)
 def scrape_books_data():
     """Scrape book data from books.toscrape.com"""
     base_url = 'https://books.toscrape.com/catalogue/page-{}.html'
     data = []
+    failed = []
+    
+    pages = range(1, 6)
+    
+    # Just scrape first 5 pages for demo (to make it faster), fetched concurrently
+    with requests.Session() as session:
+        session.mount('https://', HTTPAdapter(pool_maxsize=len(pages)))
+        with ThreadPoolExecutor(max_workers=len(pages)) as ex:
+            responses = list(ex.map(lambda p: _fetch_page(session, base_url.format(p)), pages))
     
-    # Just scrape first 5 pages for demo (to make it faster)
-    for page in range(1, 6):
-        url = base_url.format(page)
+    for page, (web, error) in zip(pages, responses):
+        if error is not None:
+            st.error(f"Error scraping page {page}: {error}")
+            failed.append(page)
+            continue
         try:
-            web = requests.get(url)
-            soup = BeautifulSoup(web.text, 'html.parser')
-            
-            books_list = soup.find('ol', class_='row')
-            if books_list:
-                books = books_list.find_all('article', class_='product_pod')
-                
-                for book in books:
-                    title = book.h3.a['title']
-                    price = book.find('p', class_='price_color').text
-                    availability = book.find('p', class_='instock availability').text.strip()
-                    
-                    data.append({
-                        'Book_Name': title,
-                        'price': price,
-                        'availability': availability
-                    })
+            try:
+                data.extend(_parse_books_regex(web.content))
+            except Exception:
+                data.extend(_parse_books_soup(web.content))
         except Exception as e:
             st.error(f"Error scraping page {page}: {e}")
+            failed.append(page)
+    
+    # Raising keeps a partial scrape out of the cache and off disk
+    if failed:
+        raise RuntimeError(f"could not scrape pages {failed}")
+    return data
+
+def _fetch_page(session, url):
+    """Fetch a single page, returning (response, error)"""
+    try:
+        web = session.get(url, timeout=10)
+        web.raise_for_status()
+        return web, None
+    except Exception as e:
+        return None, e
+
+def _parse_books_regex(content):
+    """Extract book fields from raw page bytes with precompiled regexes"""
+    titles = _TITLE_RE.findall(content)
+    prices = _PRICE_RE.findall(content)
+    availabilities = _AVAIL_RE.findall(content)
+    if not titles or not (len(titles) == len(prices) == len(availabilities)):
+        raise ValueError("Unexpected page structure")
+    return [
+        {
+            'Book_Name': html.unescape(title.decode('utf-8')),
+            'price': price.decode('utf-8'),
+            'availability': availability.decode('utf-8')
+        }
+        for title, price, availability in zip(titles, prices, availabilities)
+    ]
+
+def _parse_books_soup(content):
+    """Extract book fields from raw page bytes with BeautifulSoup"""
+    data = []
+    soup = BeautifulSoup(content, 'lxml')
     
+    books_list = soup.find('ol', class_='row')
+    if books_list:
+        books = books_list.find_all('article', class_='product_pod')
+        
+        for book in books:
+            title = book.h3.a['title']
+            price = book.find('p', class_='price_color').text
+            availability = book.find('p', class_='instock availability').text.strip()
+            
+            data.append({
+                'Book_Name': title,
+                'price': price,
+                'availability': availability
+            })
     return data
 
+def in_stock_mask(availability):
+    """Boolean mask of in-stock rows, matched per category rather than per row"""
+    categories = availability.cat.categories.astype(str).str.lower()
+    category_in_stock = np.append(categories.str.contains('in stock', na=False), False)
+    # Missing values have code -1, which picks the trailing False
+    return category_in_stock[availability.cat.codes.to_numpy()]
+
+@st.cache_data(show_spinner=False)
 def clean_data(df):
     """Clean and process the book data"""
     try:
-        df['price'] = df['price'].str.replace('Â£', '').astype(float)
-        df['price'] = df['price'].astype(int)
+        # Capture only the whole-pound part, matching the old float -> int truncation
+        df['price'] = pd.to_numeric(df['price'].str.extract(r'(\d+)(?:\.\d+)?', expand=False), errors='coerce', downcast='integer')
+        df['availability'] = df['availability'].astype('category')
     except Exception as e:
         st.error(f"Error cleaning data: {e}")
     return df
 
+@st.cache_resource(show_spinner=False)
+def _open_connection():
+    """Open the shared SQL Server connection (reused across reruns and sessions)"""
+    return pyodbc.connect(
+        "Driver={ODBC Driver 18 for SQL Server};"
+        "Server=DESKTOP-RLMEU2F;"
+        "Database=BooksDB;"
+        "Trusted_Connection=yes;"
+        "Encrypt=no;"
+    )
+
+@st.cache_resource(show_spinner=False)
+def _db_lock():
+    """Lock guarding the shared connection; pyodbc connections are not thread-safe (threadsafety = 1)"""
+    return threading.Lock()
+
 def connect_database():
     """Connect to SQL Server database"""
     try:
-        conn = pyodbc.connect(
-            "Driver={ODBC Driver 18 for SQL Server};"
-            "Server=DESKTOP-RLMEU2F;"
-            "Database=BooksDB;"
-            "Trusted_Connection=yes;"
-            "Encrypt=no;"
-        )
-        return conn
+        return _open_connection()
     except Exception as e:
         st.error(f"Database connection failed: {e}")
         return None
 
+def _read_sql(sql, params=None):
+    """Run a query on the shared connection, one thread at a time"""
+    conn = connect_database()
+    if conn is None:
+        raise ConnectionError("no database connection")
+    with _db_lock():
+        try:
+            return pd.read_sql(sql, conn, params=params)
+        except pyodbc.Error:
+            # Close and drop the cached connection so the next query reconnects
+            try:
+                conn.close()
+            except pyodbc.Error:
+                pass
+            _open_connection.clear()
+            raise
+
+def read_books_table():
+    """Read a preview of the books table from the database"""
+    return _downcast(_read_sql(f"SELECT TOP {PREVIEW_ROWS} * FROM BooksTable"))
+
+def _quote_identifier(name):
+    """Quote a column name for SQL Server"""
+    return "[" + name.replace("]", "]]") + "]"
+
+def _escape_like(term):
+    """Escape LIKE wildcards so the search term matches literally"""
+    return term.replace("[", "[[]").replace("%", "[%]").replace("_", "[_]")
+
+@st.cache_data(ttl=60, show_spinner=False)
+def query_books(price_col=None, max_price=None, availability_col=None, in_stock_only=False, title_col=None, title_like=""):
+    """Query the books table with the filters applied on the database side"""
+    clauses = []
+    params = []
+    if price_col and max_price is not None:
+        clauses.append(f"{_quote_identifier(price_col)} <= ?")
+        params.append(max_price)
+    if availability_col and in_stock_only:
+        # Same rule as the local path: "in stock" anywhere, ignoring case
+        clauses.append(f"LOWER({_quote_identifier(availability_col)}) LIKE '%in stock%'")
+    if title_col and title_like:
+        clauses.append(f"LOWER({_quote_identifier(title_col)}) LIKE ?")
+        params.append(f"%{_escape_like(title_like.lower())}%")
+    
+    sql = "SELECT * FROM BooksTable"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    
+    return _downcast(_read_sql(sql, params=params))
+
+@st.cache_data(ttl=60, show_spinner=False)
+def price_bounds(price_col):
+    """Lowest and highest price in the books table"""
+    col = _quote_identifier(price_col)
+    bounds = _read_sql(f"SELECT MIN({col}) AS min_price, MAX({col}) AS max_price FROM BooksTable")
+    return int(bounds.iloc[0, 0]), int(bounds.iloc[0, 1])
+
+@st.cache_data(ttl=60, show_spinner=False)
+def query_prices(price_col):
+    """Fetch only the price column of the books table"""
+    prices = _read_sql(f"SELECT {_quote_identifier(price_col)} FROM BooksTable")
+    return pd.to_numeric(prices.iloc[:, 0], errors='coerce')
+
 if __name__ == "__main__":
     main()
\ No newline at end of file